@@ -2,13 +2,62 @@
 Trust Lens Enhanced AI Integration - Severity-First Reasoning
 """
 
+import asyncio
+import bisect
+import hashlib
 import httpx
 import json
+import msgspec
+import orjson
 import os
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+import time
+from typing import List, Optional, Dict, Any, Final, Sequence, Tuple
+from cachetools import TTLCache
 
-class Signal(BaseModel):
+# Shared Gemini client so enhance calls reuse pooled keep-alive connections
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client, created lazily so it binds to the running event loop"""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=15.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        )
+    return _CLIENT
+
+async def aclose() -> None:
+    """Close the shared Gemini client (called on app shutdown)"""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+# Enhanced summaries keyed by prompt inputs; base summaries come from fixed templates,
+# so identical (severity, concerns, summary) combinations recur across requests
+_SUMMARY_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=24 * 60 * 60)
+
+def _summary_cache_key(severity: str, concern_titles: List[str], base_summary: str) -> bytes:
+    """Stable digest of the inputs that determine the Gemini prompt"""
+    raw = f"{severity}|{'|'.join(sorted(concern_titles))}|{base_summary}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+
+# Complete outputs keyed by everything generate_summary reads from its input
+_OUTPUT_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=60 * 60)
+
+def _output_cache_key(context: str, concern_count: int, enhance_enabled: bool, risk_signals: Sequence["Signal"]) -> bytes:
+    """Stable digest of the inputs that determine an AIOutput"""
+    raw = orjson.dumps([context, concern_count, enhance_enabled, [s.title for s in risk_signals]])
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+# Pending Gemini requests by cache key, shared by concurrent callers (single-flight)
+_INFLIGHT: Dict[bytes, "asyncio.Future[Optional[str]]"] = {}
+
+# Internal I/O types are msgspec structs: slot-based, no per-field validation on construction
+
+class Signal(msgspec.Struct, frozen=True, gc=False, kw_only=True):
     id: str
     category: str
     title: str
@@ -18,26 +67,93 @@ class Signal(BaseModel):
     severity: Optional[str] = None
     domain: Optional[str] = None
 
-class AIInput(BaseModel):
+class AIInput(msgspec.Struct, kw_only=True):
     inputType: str
     originalInput: str
     detectedContext: str
     signals: List[Signal]
-    businessPriority: Optional[Dict] = None
-    companyAssessment: Optional[Dict] = None
+    businessPriority: Optional[Dict[str, Any]] = None
+    companyAssessment: Optional[Dict[str, Any]] = None
     concernCount: int = 0
     severityLevel: str = "low"
 
-class AIOutput(BaseModel):
+class AIOutput(msgspec.Struct, frozen=True, kw_only=True):
     summary: str
     whatYouMightMiss: str
     actions: List[str]
 
+# Static guidance text, shared by the lookup tables on TrustLensAI
+
+_COMPOUND_CRITICAL: Final[str] = """The combined presence of multiple high-impact clauses creates a systemic power imbalance. Individually, each provision might appear in standard contracts, but together they form a structure that: (1) eliminates your ability to dispute or seek remedy, (2) grants the other party unilateral control over terms and access, and (3) extends obligations beyond reasonable limits. This is not a balanced agreement."""
+_COMPOUND_HIGH: Final[str] = """Several concerning provisions work together to shift significant control away from you. While not every clause is problematic on its own, their combination creates substantial risk exposure—particularly around dispute resolution, data rights, and unilateral changes. The structure favors the drafting party heavily."""
+_COMPOUND_MODERATE_GENERIC: Final[str] = "Some indicators suggest caution is warranted. Review the specific signals detected."
+_COMPOUND_LOW: Final[str] = "No significant risk patterns detected. Standard verification practices apply."
+
+_WYMM_LEGAL_HIGH: Final[str] = """What you might miss: These clauses don't just limit your current rights—they systematically remove your ability to challenge problems later. The binding arbitration clause means you cannot sue in court, even for serious harm. The unilateral change provision allows them to alter terms after you've committed, leaving you with no recourse. The data license grant is perpetual and irrevocable, extending beyond account closure. Combined, these create a legal structure where you bear all risk while they retain all control."""
+_WYMM_LEGAL_LOW: Final[str] = """No major red flags detected, but always verify: (1) Can you exit easily? (2) What happens to your data? (3) Can terms change without notice? Standard agreements should allow dispute resolution in court and limit data use to service provision."""
+_WYMM_BUSINESS_HIGH: Final[str] = """What you might miss: The urgency pressure combined with limited verifiability is a classic pattern. Legitimate opportunities don't require immediate decisions without due diligence. The lack of corporate infrastructure (no verifiable domain, no LinkedIn presence) means you're taking on partnership risk without validation. If this were credible, they would provide references and allow time for verification."""
+_WYMM_BUSINESS_LOW: Final[str] = """Key verification steps: Confirm company registration, check for active social presence, request references from past partners. Credible businesses provide this information proactively."""
+_WYMM_CONSUMER_HIGH: Final[str] = """What you might miss: Urgency + personal info requests + unknown sender = classic social engineering. The pressure to act fast is specifically designed to bypass your critical thinking. Legitimate entities don't operate this way—they provide time, verifiable contact information, and don't demand sensitive data via unsolicited messages."""
+_WYMM_CONSUMER_LOW: Final[str] = """Verify sender identity through official channels (not reply links). Check for pressure tactics. When in doubt, pause and verify independently."""
+
+_ACTIONS_LEGAL_CRITICAL: Final[Tuple[str, ...]] = (
+    "🛑 DO NOT ACCEPT without attorney review—this agreement contains systemic risk",
+    "📋 Specifically challenge: binding arbitration clause, unilateral change rights, broad data license",
+    "⚖️ Compare against industry-standard terms (e.g., major platform ToS)",
+    "✋ Consider opting out—few services are worth surrendering these rights",
+    "📄 Request modified terms removing arbitration and limiting data use"
+)
+_ACTIONS_LEGAL_HIGH: Final[Tuple[str, ...]] = (
+    "⚠️ Do not accept without understanding each flagged clause",
+    "📋 Mark specific sections for legal review (arbitration, liability, data rights)",
+    "🔍 Compare data handling and dispute terms against 2-3 similar services",
+    "📧 Request clarification on: unilateral changes, termination, data retention",
+    "✋ If protections are absent, consider alternative providers"
+)
+_ACTIONS_LEGAL_LOW: Final[Tuple[str, ...]] = (
+    "✓ Review standard sections (liability, data use, termination)",
+    "📋 Ensure you can delete account and data",
+    "🔍 Verify dispute resolution is in court, not just arbitration"
+)
+_ACTIONS_BUSINESS_HIGH: Final[Tuple[str, ...]] = (
+    "🛑 Do not proceed without verification—high-pressure + low-verifiability is a warning pattern",
+    "📋 Request: Company registration, LinkedIn profiles, 2-3 references",
+    "⏰ Insist on time for due diligence—legitimate partners allow this",
+    "🔍 Search company name + 'scam' or 'complaint'",
+    "✋ If they resist verification, disengage immediately"
+)
+_ACTIONS_BUSINESS_LOW: Final[Tuple[str, ...]] = (
+    "📋 Request company website and LinkedIn verification",
+    "📞 Schedule call after confirming company exists",
+    "🔍 Check references before sharing proprietary information"
+)
+_ACTIONS_CONSUMER_HIGH: Final[Tuple[str, ...]] = (
+    "🛑 DO NOT CLICK links or respond—this shows classic manipulation patterns",
+    "🗑️ Delete message and block sender",
+    "🔍 Verify independently through official website (not reply links)",
+    "💡 Report to platform if applicable",
+    "⚠️ If you already clicked, scan device and change passwords"
+)
+_ACTIONS_CONSUMER_LOW: Final[Tuple[str, ...]] = (
+    "⚠️ Verify sender through official channels",
+    "⏰ Take time—ignore urgency pressure",
+    "🔍 Search message content for known scams"
+)
+
 class TrustLensAI:
     """AI explainer with severity-first reasoning"""
     
     API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent"
     
+    # Output is capped near the 2-3 sentence target and stopped at the first paragraph break
+    GENERATION_CONFIG = {
+        "temperature": 0.2,
+        "maxOutputTokens": 90,
+        "candidateCount": 1,
+        "stopSequences": ["\n\n", "IMPROVED SUMMARY:"],
+        "responseMimeType": "text/plain"
+    }
+    
     SEVERITY_CONFIG = {
         "critical": {
             "label": "CRITICAL RISK",
@@ -61,6 +177,11 @@ class TrustLensAI:
         }
     }
     
+    # Ascending concern-count cut-offs derived from SEVERITY_CONFIG
+    _SEVERITY_TIERS = sorted((cfg["threshold"], name) for name, cfg in SEVERITY_CONFIG.items())
+    _SEVERITY_CUTS = [threshold for threshold, _ in _SEVERITY_TIERS]
+    _SEVERITY_NAMES = [name for _, name in _SEVERITY_TIERS]
+    
     IMPACT_TITLES = {
         "legal": {
             "critical": "Systemic Rights Erosion Structure",
@@ -82,131 +203,111 @@ class TrustLensAI:
         }
     }
     
+    COMPOUND_EXPLANATIONS = {
+        "critical": _COMPOUND_CRITICAL,
+        "high": _COMPOUND_HIGH,
+        "low": _COMPOUND_LOW
+    }
+    
+    # Context groups for the guidance tables; unlisted contexts use "consumer"
+    WHAT_YOU_MIGHT_MISS_GROUPS = {
+        "legal_agreement": "legal",
+        "partnership_offer": "business",
+        "vendor_proposal": "business",
+        "client_inquiry": "business"
+    }
+    
+    ACTION_GROUPS = {
+        "legal_agreement": "legal",
+        "partnership_offer": "business",
+        "vendor_proposal": "business"
+    }
+    
+    # (group, severity) -> text; severities without a row use the group's "low" row
+    WHAT_YOU_MIGHT_MISS = {
+        ("legal", "critical"): _WYMM_LEGAL_HIGH,
+        ("legal", "high"): _WYMM_LEGAL_HIGH,
+        ("legal", "low"): _WYMM_LEGAL_LOW,
+        ("business", "critical"): _WYMM_BUSINESS_HIGH,
+        ("business", "high"): _WYMM_BUSINESS_HIGH,
+        ("business", "low"): _WYMM_BUSINESS_LOW,
+        ("consumer", "critical"): _WYMM_CONSUMER_HIGH,
+        ("consumer", "high"): _WYMM_CONSUMER_HIGH,
+        ("consumer", "low"): _WYMM_CONSUMER_LOW
+    }
+    
+    ACTIONS = {
+        ("legal", "critical"): _ACTIONS_LEGAL_CRITICAL,
+        ("legal", "high"): _ACTIONS_LEGAL_HIGH,
+        ("legal", "low"): _ACTIONS_LEGAL_LOW,
+        ("business", "critical"): _ACTIONS_BUSINESS_HIGH,
+        ("business", "high"): _ACTIONS_BUSINESS_HIGH,
+        ("business", "low"): _ACTIONS_BUSINESS_LOW,
+        ("consumer", "critical"): _ACTIONS_CONSUMER_HIGH,
+        ("consumer", "high"): _ACTIONS_CONSUMER_HIGH,
+        ("consumer", "low"): _ACTIONS_CONSUMER_LOW
+    }
+    
+    # Consecutive Gemini failures before enhancement is bypassed, and for how long (seconds)
+    BREAKER_THRESHOLD = 5
+    BREAKER_COOLDOWN = 30.0
+    
+    # Severities whose summary is worth a Gemini rewrite
+    _HOT_SEVERITIES = frozenset({"critical", "high"})
+    
     def __init__(self):
         self.api_key = os.getenv("GEMINI_API_KEY")
+        self._enhance_enabled = bool(self.api_key)
+        self._breaker_fail_count = 0
+        self._breaker_open_until = 0.0
     
     def _determine_severity(self, input_data: AIInput) -> str:
         """Determine overall severity based on concern count"""
-        count = input_data.concernCount
-        
-        if count >= 6:
-            return "critical"
-        elif count >= 3:
-            return "high"
-        elif count >= 1:
-            return "moderate"
-        return "low"
+        tier = bisect.bisect_right(self._SEVERITY_CUTS, input_data.concernCount) - 1
+        return self._SEVERITY_NAMES[max(tier, 0)]
     
-    def _build_compound_explanation(self, signals: List[Signal], context: str, severity: str) -> str:
+    def _build_compound_explanation(self, risk_signals: Sequence[Signal], context: str, severity: str) -> str:
         """Build explanation of how multiple clauses interact"""
         
-        if severity == "critical":
-            return """The combined presence of multiple high-impact clauses creates a systemic power imbalance. Individually, each provision might appear in standard contracts, but together they form a structure that: (1) eliminates your ability to dispute or seek remedy, (2) grants the other party unilateral control over terms and access, and (3) extends obligations beyond reasonable limits. This is not a balanced agreement."""
-        
-        elif severity == "high":
-            return """Several concerning provisions work together to shift significant control away from you. While not every clause is problematic on its own, their combination creates substantial risk exposure—particularly around dispute resolution, data rights, and unilateral changes. The structure favors the drafting party heavily."""
-        
-        elif severity == "moderate":
-            risk_signals = [s for s in signals if s.category == 'risk']
+        if severity == "moderate":
             if risk_signals:
                 return f"""Detected {len(risk_signals)} area{'s' if len(risk_signals) > 1 else ''} of concern: {', '.join([s.title for s in risk_signals[:2]])}. These provisions warrant careful review before proceeding."""
-            return "Some indicators suggest caution is warranted. Review the specific signals detected."
+            return _COMPOUND_MODERATE_GENERIC
         
-        return "No significant risk patterns detected. Standard verification practices apply."
+        return self.COMPOUND_EXPLANATIONS.get(severity, _COMPOUND_LOW)
     
     def _build_what_you_might_miss(self, signals: List[Signal], context: str, severity: str) -> str:
         """Build consequence-focused 'what you might miss' section"""
         
-        if context == "legal_agreement":
-            if severity in ["critical", "high"]:
-                return """What you might miss: These clauses don't just limit your current rights—they systematically remove your ability to challenge problems later. The binding arbitration clause means you cannot sue in court, even for serious harm. The unilateral change provision allows them to alter terms after you've committed, leaving you with no recourse. The data license grant is perpetual and irrevocable, extending beyond account closure. Combined, these create a legal structure where you bear all risk while they retain all control."""
-            else:
-                return """No major red flags detected, but always verify: (1) Can you exit easily? (2) What happens to your data? (3) Can terms change without notice? Standard agreements should allow dispute resolution in court and limit data use to service provision."""
-        
-        elif context in ["partnership_offer", "vendor_proposal", "client_inquiry"]:
-            if severity in ["critical", "high"]:
-                return """What you might miss: The urgency pressure combined with limited verifiability is a classic pattern. Legitimate opportunities don't require immediate decisions without due diligence. The lack of corporate infrastructure (no verifiable domain, no LinkedIn presence) means you're taking on partnership risk without validation. If this were credible, they would provide references and allow time for verification."""
-            else:
-                return """Key verification steps: Confirm company registration, check for active social presence, request references from past partners. Credible businesses provide this information proactively."""
-        
-        else:  # consumer_message
-            if severity in ["critical", "high"]:
-                return """What you might miss: Urgency + personal info requests + unknown sender = classic social engineering. The pressure to act fast is specifically designed to bypass your critical thinking. Legitimate entities don't operate this way—they provide time, verifiable contact information, and don't demand sensitive data via unsolicited messages."""
-            else:
-                return """Verify sender identity through official channels (not reply links). Check for pressure tactics. When in doubt, pause and verify independently."""
+        group = self.WHAT_YOU_MIGHT_MISS_GROUPS.get(context, "consumer")
+        return self.WHAT_YOU_MIGHT_MISS.get((group, severity)) or self.WHAT_YOU_MIGHT_MISS[(group, "low")]
     
     def _build_actions(self, context: str, severity: str, signals: List[Signal]) -> List[str]:
         """Build decision-oriented action items"""
         
-        actions = []
-        
-        if context == "legal_agreement":
-            if severity == "critical":
-                actions = [
-                    "🛑 DO NOT ACCEPT without attorney review—this agreement contains systemic risk",
-                    "📋 Specifically challenge: binding arbitration clause, unilateral change rights, broad data license",
-                    "⚖️ Compare against industry-standard terms (e.g., major platform ToS)",
-                    "✋ Consider opting out—few services are worth surrendering these rights",
-                    "📄 Request modified terms removing arbitration and limiting data use"
-                ]
-            elif severity == "high":
-                actions = [
-                    "⚠️ Do not accept without understanding each flagged clause",
-                    "📋 Mark specific sections for legal review (arbitration, liability, data rights)",
-                    "🔍 Compare data handling and dispute terms against 2-3 similar services",
-                    "📧 Request clarification on: unilateral changes, termination, data retention",
-                    "✋ If protections are absent, consider alternative providers"
-                ]
-            else:
-                actions = [
-                    "✓ Review standard sections (liability, data use, termination)",
-                    "📋 Ensure you can delete account and data",
-                    "🔍 Verify dispute resolution is in court, not just arbitration"
-                ]
-        
-        elif context in ["partnership_offer", "vendor_proposal"]:
-            if severity in ["critical", "high"]:
-                actions = [
-                    "🛑 Do not proceed without verification—high-pressure + low-verifiability is a warning pattern",
-                    "📋 Request: Company registration, LinkedIn profiles, 2-3 references",
-                    "⏰ Insist on time for due diligence—legitimate partners allow this",
-                    "🔍 Search company name + 'scam' or 'complaint'",
-                    "✋ If they resist verification, disengage immediately"
-                ]
-            else:
-                actions = [
-                    "📋 Request company website and LinkedIn verification",
-                    "📞 Schedule call after confirming company exists",
-                    "🔍 Check references before sharing proprietary information"
-                ]
-        
-        else:  # consumer_message
-            if severity in ["critical", "high"]:
-                actions = [
-                    "🛑 DO NOT CLICK links or respond—this shows classic manipulation patterns",
-                    "🗑️ Delete message and block sender",
-                    "🔍 Verify independently through official website (not reply links)",
-                    "💡 Report to platform if applicable",
-                    "⚠️ If you already clicked, scan device and change passwords"
-                ]
-            else:
-                actions = [
-                    "⚠️ Verify sender through official channels",
-                    "⏰ Take time—ignore urgency pressure",
-                    "🔍 Search message content for known scams"
-                ]
-        
-        return actions
+        group = self.ACTION_GROUPS.get(context, "consumer")
+        return list(self.ACTIONS.get((group, severity)) or self.ACTIONS[(group, "low")])
     
     async def generate_summary(self, input_data: AIInput) -> AIOutput:
         """Generate comprehensive severity-aligned output"""
         
         severity = self._determine_severity(input_data)
         signals = input_data.signals
+        risk_signals = tuple(s for s in signals if s.category == 'risk')
         context = input_data.detectedContext
+        enhance_eligible = self._enhance_enabled and severity in self._HOT_SEVERITIES
+        
+        key = _output_cache_key(context, input_data.concernCount, enhance_eligible, risk_signals)
+        cached = _OUTPUT_CACHE.get(key)
+        if cached is not None:
+            return cached
         
-        # Build compound explanation
-        summary = self._build_compound_explanation(signals, context, severity)
+        # If Gemini is available, start the enhancement first so the builders
+        # below run while the request is in flight
+        enhance_task = None
+        if enhance_eligible:
+            enhance_task = asyncio.create_task(self._enhance_with_gemini(input_data, risk_signals, severity))
+            await asyncio.sleep(0)  # let the task dispatch its request
         
         # Build what you might miss
         what_you_might_miss = self._build_what_you_might_miss(signals, context, severity)
@@ -214,30 +315,66 @@ class TrustLensAI:
         # Build actions
         actions = self._build_actions(context, severity, signals)
         
-        # If Gemini is available, enhance the summary
-        if self.api_key and severity in ["critical", "high"]:
+        summary = None
+        if enhance_task is not None:
             try:
-                enhanced = await self._enhance_with_gemini(input_data, summary, severity)
-                if enhanced:
-                    summary = enhanced
-            except:
+                summary = await enhance_task
+            except Exception:
                 pass  # Use rule-based summary if API fails
         
-        return AIOutput(
+        # Build compound explanation only when Gemini did not replace it
+        enhanced = bool(summary)
+        if not enhanced:
+            summary = self._build_compound_explanation(risk_signals, context, severity)
+        
+        output = AIOutput(
             summary=summary,
             whatYouMightMiss=what_you_might_miss,
             actions=actions
         )
+        
+        # A rule-based fallback after a failed enhancement is not cached, so later calls retry Gemini
+        if enhanced or not enhance_eligible:
+            _OUTPUT_CACHE[key] = output
+        return output
     
-    async def _enhance_with_gemini(self, input_data: AIInput, base_summary: str, severity: str) -> Optional[str]:
+    async def _enhance_with_gemini(self, input_data: AIInput, risk_signals: Sequence[Signal], severity: str) -> Optional[str]:
         """Enhance summary with Gemini for high-severity cases"""
         
-        concern_titles = [s.title for s in input_data.signals if s.category == 'risk']
+        concern_titles = [s.title for s in risk_signals[:4]]
+        # Critical/high templates are fixed text, so the prompt seed needs no signal scan
+        base_summary = self._build_compound_explanation(risk_signals, input_data.detectedContext, severity)
+        
+        key = _summary_cache_key(severity, concern_titles, base_summary)
+        cached = _SUMMARY_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
+        # Coalesce concurrent identical requests onto the one already in flight
+        inflight = _INFLIGHT.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        _INFLIGHT[key] = future
+        try:
+            enhanced = await self._request_gemini(self._build_prompt(severity, concern_titles, base_summary))
+            if enhanced:
+                _SUMMARY_CACHE[key] = enhanced
+            future.set_result(enhanced)
+            return enhanced
+        finally:
+            if not future.done():
+                future.set_result(None)
+            _INFLIGHT.pop(key, None)
+    
+    def _build_prompt(self, severity: str, concern_titles: List[str], base_summary: str) -> str:
+        """Build the Gemini rewrite prompt"""
         
-        prompt = f"""You are a legal risk analyst. Rewrite this summary to be clearer and more impactful.
+        return f"""You are a legal risk analyst. Rewrite this summary to be clearer and more impactful.
 
 SEVERITY: {severity.upper()}
-CONCERNS: {', '.join(concern_titles[:4])}
+CONCERNS: {', '.join(concern_titles)}
 
 CURRENT SUMMARY:
 {base_summary}
@@ -250,28 +387,38 @@ REQUIREMENTS:
 5. Focus on user protection, not neutrality
 
 IMPROVED SUMMARY:"""
-
+    
+    async def _request_gemini(self, prompt: str) -> Optional[str]:
+        """POST a prompt to Gemini and return the first candidate's text"""
+        
+        # Skip the call entirely while the breaker is open after repeated failures
+        if time.monotonic() < self._breaker_open_until:
+            return None
+        
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(
-                    f"{self.API_URL}?key={self.api_key}",
-                    headers={"Content-Type": "application/json"},
-                    json={
-                        "contents": [{"parts": [{"text": prompt}]}],
-                        "generationConfig": {
-                            "temperature": 0.2,
-                            "maxOutputTokens": 150
-                        }
-                    }
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    if 'candidates' in result:
-                        return result['candidates'][0]['content']['parts'][0]['text'].strip()
-        except:
-            pass
+            response = await _get_client().post(
+                f"{self.API_URL}?key={self.api_key}",
+                headers={"Content-Type": "application/json"},
+                content=orjson.dumps({
+                    "contents": [{"parts": [{"text": prompt}]}],
+                    "generationConfig": self.GENERATION_CONFIG
+                })
+            )
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            text = result['candidates'][0]['content']['parts'][0]['text'].strip() if 'candidates' in result else None
+        except (httpx.HTTPError, orjson.JSONDecodeError, KeyError, IndexError, TypeError):
+            self._record_gemini_failure()
+            return None
         
-        return None
+        self._breaker_fail_count = 0
+        return text
+    
+    def _record_gemini_failure(self) -> None:
+        """Count a failed Gemini call and open the breaker once the threshold is reached"""
+        self._breaker_fail_count += 1
+        if self._breaker_fail_count >= self.BREAKER_THRESHOLD:
+            self._breaker_open_until = time.monotonic() + self.BREAKER_COOLDOWN
+            self._breaker_fail_count = 0
 
 ai_generator = TrustLensAI()
@@ -4,18 +4,22 @@ Trust Lens Enhanced Backend - Severity-First Decision Intelligence
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
+from cachetools import TTLCache
 import re
+import re2
 import hashlib
 import httpx
+import msgspec
 import asyncio
 import os
 
-from ai_generator import TrustLensAI, AIInput, AIOutput, Signal as AISignal
+from ai_generator import TrustLensAI, AIInput, AIOutput, Signal as AISignal, aclose as close_ai_client
 
-app = FastAPI(title="Trust Lens API", version="3.0.0")
+app = FastAPI(title="Trust Lens API", version="3.0.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,6 +31,11 @@ app.add_middleware(
 
 ai_generator = TrustLensAI()
 
+@app.on_event("shutdown")
+async def shutdown():
+    await close_ai_client()
+    await close_scrape_client()
+
 # ============ DATA MODELS ============
 
 class SignalLevel(str, Enum):
@@ -34,13 +43,16 @@ class SignalLevel(str, Enum):
     YELLOW = "yellow"
     RED = "red"
 
-class Signal(BaseModel):
+# Response types are built only by the engine, never parsed from requests, so they are
+# msgspec structs: slot-based, no per-field validation on construction
+
+class Signal(msgspec.Struct, frozen=True, gc=False, kw_only=True):
     name: str
     level: SignalLevel
     message: str
     confidence: float
 
-class BusinessPriorityAssessment(BaseModel):
+class BusinessPriorityAssessment(msgspec.Struct, frozen=True, kw_only=True):
     strategicImportance: str
     attentionWorthiness: str
     riskToRewardBalance: str
@@ -48,17 +60,17 @@ class BusinessPriorityAssessment(BaseModel):
     confidenceFactors: List[str]
     concerns: List[str]
 
-class CompanyAssessment(BaseModel):
+class CompanyAssessment(msgspec.Struct, frozen=True, kw_only=True):
     visibility: str
     trackRecord: str
     flags: List[str]
     confidenceFactors: List[str]
 
-class TrustAnalysis(BaseModel):
+class TrustAnalysis(msgspec.Struct, frozen=True, kw_only=True):
     overall_score: int
     overall_level: str  # Changed to string for severity labels
     signals: List[Signal]
-    external_checks: List[Dict]
+    external_checks: List[Dict[str, Any]]
     summary: str
     whatYouMightMiss: str
     recommendedActions: List[str]
@@ -69,77 +81,184 @@ class TrustAnalysis(BaseModel):
     severityLevel: str = "low"
 
 class AnalysisRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     content: str
     content_type: str = "text"
 
+# ============ PATTERNS ============
+
+def _compile_search_set(patterns, case_sensitive: bool = True) -> re2.Set:
+    """Compile patterns into one RE2 set reporting every pattern that matches anywhere in a text.
+    Raises at import if a pattern uses syntax RE2 does not support (e.g. lookarounds)."""
+    options = re2.Options()
+    options.case_sensitive = case_sensitive
+    search_set = re2.Set.SearchSet(options)
+    for pattern in patterns:
+        search_set.Add(pattern)
+    search_set.Compile()
+    return search_set
+
+def _re2_safe(text: str) -> str:
+    """RE2 encodes str arguments as strict UTF-8, which rejects lone surrogates (legal in JSON
+    escapes and in some decoded pages); replace them with '?' so they match as re did"""
+    try:
+        text.encode()
+    except UnicodeEncodeError:
+        return text.encode("utf-8", "replace").decode()
+    return text
+
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_DOMAIN_RE = re.compile(r'https?://([^/]+)')
+
+# Scraped HTML is large and untrusted, so its patterns run on RE2
+_TITLE_RE = re2.compile(r'(?i)<title[^>]*>([^<]+)</title>')
+_DESC_RE = re2.compile(r'(?i)<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)')
+
+# Contact words, about links and social domains are all found in one case-insensitive pass
+_SOCIAL_DOMAINS = ('facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com')
+_HTML_FEATURE_SET = _compile_search_set(
+    [r'(contact|email|phone|address)', r'href=["\'][^"\']*about', *(re2.escape(d) for d in _SOCIAL_DOMAINS)],
+    case_sensitive=False
+)
+_HAS_CONTACT, _HAS_ABOUT, _FIRST_SOCIAL = 0, 1, 2
+
+# Urgency, action and consequence words in one RE2 pass over the lowercased text (RE2's
+# case folding would also match e.g. the long s in "aſap"). RE2's \b is ASCII-only, so
+# the boundary is spelled out over Unicode letters and digits as re's \b is
+_NON_WORD = r'[^\pL\pN_]'
+_PRESSURE_SET = _compile_search_set(
+    [rf'(?:^|{_NON_WORD})(?:{words})(?:$|{_NON_WORD})' for words in (
+        'urgent|asap|immediately|now|today|hurry|rush',
+        'click|respond|reply|act|confirm',
+        'expire|lose|miss out|forfeit|limited',
+    )]
+)
+_URGENCY, _ACTION_DEMAND, _CONSEQUENCE = 0, 1, 2
+
+_WEBSITE_RE = re.compile(r'https?://[^\s]+')
+_LINKEDIN_RE = re.compile(r'linkedin\.com', re.IGNORECASE)
+_DOMAIN_EMAIL_RE = re.compile(r'@[\w]+\.(com|io|ai|co|org|net)')
+_COMPANY_NAME_RE = re.compile(r'\b(Inc\.?|LLC|Ltd\.?|Corp\.?|Company)\b')
+
+_CORP_EMAIL_RE = re.compile(r'[\w.]+@([\w]+\.(com|io|ai|co|org|net))')
+_COMPANY_EXTRACT_RE = re.compile(r'(?:at|from|of)\s+([A-Z][\w\s]+(?:Inc|LLC|Ltd|Corp|Company|Solutions|Technologies|AI|Labs))')
+
 # ============ WEBSITE SCRAPER ============
 
+# Shared Scrape.do client so scrapes reuse pooled keep-alive connections
+_SCRAPE_CLIENT: Optional[httpx.AsyncClient] = None
+
+def _get_scrape_client() -> httpx.AsyncClient:
+    """Return the shared client, created lazily so it binds to the running event loop"""
+    global _SCRAPE_CLIENT
+    if _SCRAPE_CLIENT is None or _SCRAPE_CLIENT.is_closed:
+        _SCRAPE_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=200)
+        )
+    return _SCRAPE_CLIENT
+
+async def close_scrape_client() -> None:
+    """Close the shared Scrape.do client (called on app shutdown)"""
+    global _SCRAPE_CLIENT
+    if _SCRAPE_CLIENT is not None:
+        await _SCRAPE_CLIENT.aclose()
+        _SCRAPE_CLIENT = None
+
 class WebsiteScraper:
+    SCRAPE_DO_API_URL = "https://api.scrape.do"
     SCRAPE_DO_API_KEY = os.getenv("SCRAPE_DO_API_KEY", "")
+    # Title, description and links are read from at most this much of the page
+    MAX_HTML_BYTES = 512 * 1024
     
     async def scrape(self, url: str) -> Dict[str, Any]:
         try:
             if not self.SCRAPE_DO_API_KEY:
                 return {"success": False, "error": "SCRAPE_DO_API_KEY not set"}
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                scrape_url = f"http://api.scrape.do?token={self.SCRAPE_DO_API_KEY}&url={url}"
-                response = await client.get(scrape_url)
-                
+            # Stream the page and stop reading once the size cap is reached
+            async with _get_scrape_client().stream(
+                "GET",
+                self.SCRAPE_DO_API_URL,
+                params={"token": self.SCRAPE_DO_API_KEY, "url": url}
+            ) as response:
                 if response.status_code != 200:
                     return {"success": False, "error": f"Scrape.do error: HTTP {response.status_code}"}
                 
-                html = response.text
-                title_match = re.search(r'<title[^>]*>([^<]+)</title>', html, re.IGNORECASE)
-                title = title_match.group(1).strip() if title_match else "Unknown"
-                
-                desc_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)', html, re.IGNORECASE)
-                description = desc_match.group(1) if desc_match else ""
-                
-                has_contact = bool(re.search(r'(contact|email|phone|address)', html, re.IGNORECASE))
-                has_about = bool(re.search(r'href=["\'][^"\']*about', html, re.IGNORECASE))
-                social_patterns = ['facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com']
-                social_links = [s for s in social_patterns if s in html.lower()]
-                
-                return {
-                    "success": True,
-                    "title": title,
-                    "description": description,
-                    "has_contact": has_contact,
-                    "has_about": has_about,
-                    "social_links": social_links,
-                    "domain": self._extract_domain(url)
-                }
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) >= self.MAX_HTML_BYTES:
+                        break
+                encoding = response.encoding or "utf-8"
+            
+            html = _re2_safe(body[:self.MAX_HTML_BYTES].decode(encoding, errors="replace"))
+            title_match = _TITLE_RE.search(html)
+            title = title_match.group(1).strip() if title_match else "Unknown"
+            
+            desc_match = _DESC_RE.search(html)
+            description = desc_match.group(1) if desc_match else ""
+            
+            features = set(_HTML_FEATURE_SET.Match(html) or ())
+            has_contact = _HAS_CONTACT in features
+            has_about = _HAS_ABOUT in features
+            social_links = [s for i, s in enumerate(_SOCIAL_DOMAINS, _FIRST_SOCIAL) if i in features]
+            
+            return {
+                "success": True,
+                "title": title,
+                "description": description,
+                "has_contact": has_contact,
+                "has_about": has_about,
+                "social_links": social_links,
+                "domain": self._extract_domain(url)
+            }
         except Exception as e:
             return {"success": False, "error": str(e)}
     
     def _extract_domain(self, url: str) -> str:
-        match = re.search(r'https?://([^/]+)', url)
+        match = _DOMAIN_RE.search(url)
         return match.group(1) if match else url
 
 # ============ CONTEXT DETECTOR ============
 
-def detect_context(content: str, content_type: str) -> str:
-    lower = content.lower()
+_LEGAL_MARKERS = frozenset({'terms of service', 'user agreement', 'privacy policy', 'legal agreement',
+                            'contract', 'terms and conditions', 'terms of use', 'binding arbitration',
+                            'liability waiver', 'indemnification', 'intellectual property'})
+_PARTNERSHIP_KWS = frozenset({'partnership', 'collaboration', 'synergy', 'strategic alliance'})
+_CLIENT_KWS = frozenset({'client inquiry', 'customer inquiry', 'interested in your services'})
+_VENDOR_KWS = frozenset({'vendor', 'supplier', 'quote', 'pricing'})
+_JOB_KWS = frozenset({'job offer', 'employment', 'hiring', 'position', 'salary'})
+
+# Contexts that get identity verification, scraping and business assessments
+_BUSINESS_CONTEXTS = frozenset({'partnership_offer', 'client_inquiry', 'vendor_proposal'})
+
+# Every marker is found in one RE2 pass; set indices map back through this tuple
+_CONTEXT_MARKERS = (*_LEGAL_MARKERS, *_PARTNERSHIP_KWS, *_CLIENT_KWS, *_VENDOR_KWS, *_JOB_KWS)
+_CONTEXT_MARKER_SET = _compile_search_set(re2.escape(marker) for marker in _CONTEXT_MARKERS)
+
+def detect_context(content: str, content_type: str, lower: Optional[str] = None) -> str:
+    if lower is None:
+        lower = content.lower()
+    found = {_CONTEXT_MARKERS[i] for i in _CONTEXT_MARKER_SET.Match(lower) or ()}
     
-    legal_markers = ['terms of service', 'user agreement', 'privacy policy', 'legal agreement', 
-                     'contract', 'terms and conditions', 'terms of use', 'binding arbitration',
-                     'liability waiver', 'indemnification', 'intellectual property']
-    legal_count = sum(1 for marker in legal_markers if marker in lower)
+    legal_count = len(found & _LEGAL_MARKERS)
     
-    if legal_count >= 2 or 'terms of service' in lower or 'user agreement' in lower:
+    if legal_count >= 2 or 'terms of service' in found or 'user agreement' in found:
         return 'legal_agreement'
     
-    if any(word in lower for word in ['partnership', 'collaboration', 'synergy', 'strategic alliance']):
+    if found & _PARTNERSHIP_KWS:
         return 'partnership_offer'
     
-    if any(word in lower for word in ['client inquiry', 'customer inquiry', 'interested in your services']):
+    if found & _CLIENT_KWS:
         return 'client_inquiry'
     
-    if any(word in lower for word in ['vendor', 'supplier', 'quote', 'pricing']) and 'contract' not in lower:
+    if found & _VENDOR_KWS and 'contract' not in found:
         return 'vendor_proposal'
     
-    if any(word in lower for word in ['job offer', 'employment', 'hiring', 'position', 'salary']):
+    if found & _JOB_KWS:
         return 'consumer_message'
     
     return 'consumer_message'
@@ -157,6 +276,7 @@ class TrustRule:
 class LegalClauseRule(TrustRule):
     """Detects concerning legal clauses - returns MULTIPLE signals"""
     
+    # Matched against the lowercased document in a single RE2 pass (linear time, no backtracking)
     CONCERNING_PATTERNS = [
         (r'irrevocably agree|binding arbitration.*waive.*(court|trial|jury)', "Binding Arbitration & Rights Waiver", "VERY_HIGH"),
         (r'class action.*waive|waive.*class action', "Class Action Waiver", "VERY_HIGH"),
@@ -174,17 +294,22 @@ class LegalClauseRule(TrustRule):
         (r'consent.*future.*terms|terms not yet written', "Future Terms Consent", "VERY_HIGH"),
     ]
     
-    def evaluate_all(self, content: str, context: str) -> List[Signal]:
+    _CLAUSE_SET = _compile_search_set(pattern for pattern, _, _ in CONCERNING_PATTERNS)
+    _RED_SEVERITIES = frozenset({"VERY_HIGH", "HIGH"})
+    
+    def evaluate_all(self, content: str, context: str, lower: Optional[str] = None) -> List[Signal]:
         """Return ALL detected concerning clauses as separate signals"""
         if context != 'legal_agreement':
             return []
         
-        lower = content.lower()
+        if lower is None:
+            lower = content.lower()
+        matched = set(self._CLAUSE_SET.Match(lower) or ())
         signals = []
         
-        for pattern, name, severity in self.CONCERNING_PATTERNS:
-            if re.search(pattern, lower):
-                level = SignalLevel.RED if severity in ["VERY_HIGH", "HIGH"] else SignalLevel.YELLOW
+        for index, (pattern, name, severity) in enumerate(self.CONCERNING_PATTERNS):
+            if index in matched:
+                level = SignalLevel.RED if severity in self._RED_SEVERITIES else SignalLevel.YELLOW
                 confidence = 0.95 if severity == "VERY_HIGH" else 0.85 if severity == "HIGH" else 0.75
                 
                 signals.append(Signal(
@@ -199,13 +324,15 @@ class LegalClauseRule(TrustRule):
 class HighPressurePatternRule(TrustRule):
     """Detects high-pressure manipulation patterns"""
     
-    def evaluate(self, content: str, content_type: str, context: str) -> Optional[Signal]:
-        lower = content.lower()
+    def evaluate(self, content: str, content_type: str, context: str, lower: Optional[str] = None) -> Optional[Signal]:
+        if lower is None:
+            lower = content.lower()
         
         # Check for urgency + action combination
-        urgency = bool(re.search(r'\b(urgent|asap|immediately|now|today|hurry|rush)\b', lower))
-        action_demand = bool(re.search(r'\b(click|respond|reply|act|confirm)\b', lower))
-        consequence = bool(re.search(r'\b(expire|lose|miss out|forfeit|limited)\b', lower))
+        found = set(_PRESSURE_SET.Match(lower) or ())
+        urgency = _URGENCY in found
+        action_demand = _ACTION_DEMAND in found
+        consequence = _CONSEQUENCE in found
         
         if urgency and action_demand and consequence:
             return Signal(
@@ -228,13 +355,13 @@ class VerifiabilityRule(TrustRule):
     """Checks for verifiable information in business contexts"""
     
     def evaluate(self, content: str, content_type: str, context: str) -> Optional[Signal]:
-        if context not in ['partnership_offer', 'client_inquiry', 'vendor_proposal']:
+        if context not in _BUSINESS_CONTEXTS:
             return None
         
-        has_website = bool(re.search(r'https?://[^\s]+', content))
-        has_linkedin = bool(re.search(r'linkedin\.com', content.lower()))
-        has_domain_email = bool(re.search(r'@[\w]+\.(com|io|ai|co|org|net)', content))
-        has_company_name = bool(re.search(r'\b(Inc\.?|LLC|Ltd\.?|Corp\.?|Company)\b', content))
+        has_website = bool(_WEBSITE_RE.search(content))
+        has_linkedin = bool(_LINKEDIN_RE.search(content))
+        has_domain_email = bool(_DOMAIN_EMAIL_RE.search(content))
+        has_company_name = bool(_COMPANY_NAME_RE.search(content))
         
         verifiable_count = sum([has_website, has_linkedin, has_domain_email, has_company_name])
         
@@ -257,14 +384,29 @@ class VerifiabilityRule(TrustRule):
 
 # ============ BUSINESS ASSESSMENT FUNCTIONS ============
 
+_HIGH_SEVERITY_LEVELS = frozenset({'critical', 'high'})
+_PERSONAL_EMAIL_DOMAINS = frozenset({'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com'})
+
 def assess_business_priority(signals: List[Signal], context: str, severity_level: str) -> BusinessPriorityAssessment:
     """Assess business priority based on signals and severity"""
     
-    risk_count = sum(1 for s in signals if s.level == SignalLevel.RED)
-    green_count = sum(1 for s in signals if s.level == SignalLevel.GREEN)
+    # One pass collects the names and the counts the priority branches need
+    confidence_factors = []
+    concerns = []
+    risk_count = 0
+    
+    for sig in signals:
+        level = sig.level
+        if level is SignalLevel.GREEN:
+            confidence_factors.append(sig.name)
+        elif level is SignalLevel.RED or level is SignalLevel.YELLOW:
+            concerns.append(sig.name)
+            risk_count += level is SignalLevel.RED
+    
+    green_count = len(confidence_factors)
     
     # Override based on severity
-    if severity_level in ['critical', 'high']:
+    if severity_level in _HIGH_SEVERITY_LEVELS:
         strategic = "low"
         attention = "ignore"
         risk_reward = "unfavorable"
@@ -285,15 +427,6 @@ def assess_business_priority(signals: List[Signal], context: str, severity_level
         risk_reward = "unfavorable"
         time_rec = "Does not merit significant time investment"
     
-    confidence_factors = []
-    concerns = []
-    
-    for sig in signals:
-        if sig.level == SignalLevel.GREEN:
-            confidence_factors.append(sig.name)
-        elif sig.level in [SignalLevel.RED, SignalLevel.YELLOW]:
-            concerns.append(sig.name)
-    
     return BusinessPriorityAssessment(
         strategicImportance=strategic,
         attentionWorthiness=attention,
@@ -310,10 +443,10 @@ def assess_company(content: str, scraped: Optional[Dict] = None) -> CompanyAsses
     confidence_factors = []
     
     # Check for corporate email
-    corp_email = re.search(r'[\w.]+@([\w]+\.(com|io|ai|co|org|net))', content)
+    corp_email = _CORP_EMAIL_RE.search(content)
     if corp_email:
         domain = corp_email.group(1)
-        if domain not in ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com']:
+        if domain not in _PERSONAL_EMAIL_DOMAINS:
             confidence_factors.append("Corporate email domain")
             track_record = "claimed"
         else:
@@ -324,7 +457,7 @@ def assess_company(content: str, scraped: Optional[Dict] = None) -> CompanyAsses
         track_record = "unknown"
     
     # Check for company name
-    company_patterns = re.findall(r'(?:at|from|of)\s+([A-Z][\w\s]+(?:Inc|LLC|Ltd|Corp|Company|Solutions|Technologies|AI|Labs))', content)
+    company_patterns = _COMPANY_EXTRACT_RE.findall(content)
     if company_patterns:
         confidence_factors.append("Company name provided")
     else:
@@ -350,39 +483,90 @@ def assess_company(content: str, scraped: Optional[Dict] = None) -> CompanyAsses
 
 # ============ ENGINE ============
 
+# Rule-stage results keyed by content. The AI step is not stored here: it keeps its
+# own cache, which skips failed Gemini enhancements so later requests retry them.
+# Entries hold the AI input without originalInput, so they do not pin the documents
+_ANALYSIS_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=10 * 60)
+
+def _analysis_cache_key(content: str, content_type: str) -> Tuple[str, bytes]:
+    """Content type plus a digest of the content (lone surrogates from JSON escapes included)"""
+    return content_type, hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+# Rules over shorter content block the loop for at most a few milliseconds,
+# which is less than the thread hand-off is worth
+_RULES_OFFLOAD_MIN_CHARS = 64 * 1024
+
 class TrustLensEngine:
     def __init__(self):
-        self.rules = [
-            LegalClauseRule("Legal Risk Analysis"),
-            HighPressurePatternRule("Manipulation Pattern Detection"),
-            VerifiabilityRule("Identity Verification"),
-        ]
+        self._legal_rule = LegalClauseRule("Legal Risk Analysis")
+        self._pressure_rule = HighPressurePatternRule("Manipulation Pattern Detection")
+        self._verify_rule = VerifiabilityRule("Identity Verification")
+        self.rules = [self._legal_rule, self._pressure_rule, self._verify_rule]
+        # AI signal ids cycle through the rule class names
+        self._rule_ids = tuple(type(rule).__name__ for rule in self.rules)
         self.scraper = WebsiteScraper()
     
     async def analyze(self, content: str, content_type: str = "text") -> TrustAnalysis:
-        context = detect_context(content, content_type)
+        key = _analysis_cache_key(content, content_type)
+        evaluation = _ANALYSIS_CACHE.get(key)
+        if evaluation is not None:
+            ai_input, report = evaluation
+            ai_input = msgspec.structs.replace(ai_input, originalInput=_re2_safe(content))
+            ai_result = await ai_generator.generate_summary(ai_input)
+        else:
+            ai_input, report, ai_result, cacheable = await self._evaluate(content, content_type)
+            if cacheable:
+                _ANALYSIS_CACHE[key] = (msgspec.structs.replace(ai_input, originalInput=""), report)
+        
+        return TrustAnalysis(
+            summary=ai_result.summary,
+            whatYouMightMiss=ai_result.whatYouMightMiss,
+            recommendedActions=ai_result.actions,
+            **report
+        )
+    
+    async def _evaluate(self, content: str, content_type: str) -> Tuple[AIInput, Dict[str, Any], AIOutput, bool]:
+        """Run the rules, AI summary and business assessments; returns the AI input, the report
+        fields, the AI output and whether the result may be cached (only if no page was scraped)"""
+        # Every RE2 scan below reads this sanitised text; lowercased once and shared
+        # by context detection, the legal rule and the pressure rule
+        content = _re2_safe(content)
+        lower = content.lower()
+        context = detect_context(content, content_type, lower)
         
-        # Extract and scrape URLs
-        urls = re.findall(r'https?://[^\s<>"{}|\\^`\[\]]+', content)
-        scraped = None
-        if urls:
-            scraped = await self.scraper.scrape(urls[0])
+        # Only the company assessment reads the scrape, so other contexts skip it. Only the
+        # first URL is scraped; start it so it is in flight while the rules run
+        url_match = _URL_RE.search(content) if context in _BUSINESS_CONTEXTS else None
+        scrape_task = None
+        if url_match:
+            scrape_task = asyncio.create_task(self.scraper.scrape(url_match.group(0)))
+            await asyncio.sleep(0)  # let the task dispatch its request
         
-        # Run all rules - collect ALL signals
-        signals = []
-        for rule in self.rules:
-            if isinstance(rule, LegalClauseRule):
-                # Legal rule returns multiple signals
-                legal_signals = rule.evaluate_all(content, context)
-                signals.extend(legal_signals)
-            else:
-                signal = rule.evaluate(content, content_type, context)
-                if signal:
-                    signals.append(signal)
+        # Run all rules - collect ALL signals. Long documents are scanned on a worker
+        # thread so the event loop keeps serving other requests in the meantime
+        if len(content) >= _RULES_OFFLOAD_MIN_CHARS:
+            signals = await asyncio.to_thread(self._run_rules_sync, content, lower, content_type, context)
+        else:
+            signals = self._run_rules_sync(content, lower, content_type, context)
         
-        # Calculate severity
-        concern_count = sum(1 for s in signals if s.level == SignalLevel.RED)
+        # One pass counts concerns and converts each signal for the AI step
+        rule_ids = self._rule_ids
+        concern_count = 0
+        ai_signals = []
+        for i, s in enumerate(signals):
+            level = s.level
+            is_red = level is SignalLevel.RED
+            concern_count += is_red
+            ai_signals.append(AISignal(
+                id=f"sig-{i}",
+                category="risk" if is_red else "uncertainty" if level is SignalLevel.YELLOW else "green",
+                title=s.name,
+                explanation=s.message,
+                ruleId=rule_ids[i % len(rule_ids)],
+                severity="high" if is_red else "medium"
+            ))
         
+        # Calculate severity
         if concern_count >= 6:
             severity_level = "critical"
             overall_level = "🔴 CRITICAL RISK"
@@ -405,44 +589,56 @@ class TrustLensEngine:
             inputType=content_type,
             originalInput=content,
             detectedContext=context,
-            signals=[AISignal(
-                id=f"sig-{i}",
-                category="risk" if s.level == SignalLevel.RED else "uncertainty" if s.level == SignalLevel.YELLOW else "green",
-                title=s.name,
-                explanation=s.message,
-                ruleId=type(self.rules[i % len(self.rules)]).__name__,
-                severity="high" if s.level == SignalLevel.RED else "medium"
-            ) for i, s in enumerate(signals)],
+            signals=ai_signals,
             concernCount=concern_count,
             severityLevel=severity_level
         )
         
-        ai_result = await ai_generator.generate_summary(ai_input)
+        # Start the AI summary so a Gemini call overlaps with the business assessments
+        ai_task = asyncio.create_task(ai_generator.generate_summary(ai_input))
+        await asyncio.sleep(0)
+        
+        scraped = await scrape_task if scrape_task is not None else None
         
         # Generate business assessments for business contexts
         business_priority = None
         company_assessment = None
-        print(f"DEBUG: context={context}, checking if in business contexts")
-        if context in ['partnership_offer', 'client_inquiry', 'vendor_proposal']:
-            print(f"DEBUG: Generating business assessments")
+        if context in _BUSINESS_CONTEXTS:
             business_priority = assess_business_priority(signals, context, severity_level)
             company_assessment = assess_company(content, scraped)
-            print(f"DEBUG: business_priority={business_priority is not None}, company_assessment={company_assessment is not None}")
         
-        return TrustAnalysis(
+        report = dict(
             overall_score=score,
             overall_level=overall_level,
             signals=signals,
             external_checks=[],
-            summary=ai_result.summary,
-            whatYouMightMiss=ai_result.whatYouMightMiss,
-            recommendedActions=ai_result.actions,
             businessPriority=business_priority,
             companyAssessment=company_assessment,
             detectedContext=context,
             concernCount=concern_count,
             severityLevel=severity_level
         )
+        # A scraped page is live state and a failed scrape may be transient, so only results
+        # without a scrape attempt (none needed, or no Scrape.do key configured) are cached
+        cacheable = scrape_task is None or not self.scraper.SCRAPE_DO_API_KEY
+        return ai_input, report, await ai_task, cacheable
+    
+    def _run_rules_sync(self, content: str, lower: str, content_type: str, context: str) -> List[Signal]:
+        # Context-specific rules are only called for their own context
+        signals = []
+        if context == 'legal_agreement':
+            # Legal rule returns multiple signals
+            signals = self._legal_rule.evaluate_all(content, context, lower)
+        
+        signal = self._pressure_rule.evaluate(content, content_type, context, lower)
+        if signal:
+            signals.append(signal)
+        
+        if context in _BUSINESS_CONTEXTS:
+            signal = self._verify_rule.evaluate(content, content_type, context)
+            if signal:
+                signals.append(signal)
+        return signals
 
 engine = TrustLensEngine()
 
@@ -456,22 +652,28 @@ def root():
 def health():
     return {"status": "healthy", "rules_loaded": len(engine.rules)}
 
+# Endpoints return a response directly, so FastAPI skips its own validation and
+# jsonable_encoder walk of the result
 @app.post("/analyze")
 async def analyze_content(request: AnalysisRequest):
     result = await engine.analyze(request.content, request.content_type)
-    return result
+    return Response(msgspec.json.encode(result), media_type="application/json")
 
 # ============ AI GENERATION ENDPOINT (for frontend compatibility) ============
 
 class AIGenerateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     inputType: str
     originalInput: str
     detectedContext: str
-    signals: List[Dict]
-    businessPriority: Optional[Dict] = None
-    companyAssessment: Optional[Dict] = None
+    signals: List[Dict[str, Any]]
+    businessPriority: Optional[Dict[str, Any]] = None
+    companyAssessment: Optional[Dict[str, Any]] = None
 
 class AIGenerateResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     summary: str
     modelUsed: str
     fallback: bool
@@ -505,17 +707,18 @@ async def generate_summary(request: AIGenerateRequest):
         # Generate
         result = await ai_generator.generate_summary(ai_input)
         
-        return AIGenerateResponse(
+        response = AIGenerateResponse(
             summary=result.summary,
             modelUsed="trustlens-v3",
             fallback=False
         )
     except Exception as e:
-        return AIGenerateResponse(
+        response = AIGenerateResponse(
             summary="Analysis complete. Review the detected signals.",
             modelUsed="fallback",
             fallback=True
         )
+    return ORJSONResponse(response.model_dump())
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,25 @@
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+def post_raw(body: bytes):
+    return client.post("/analyze", content=body, headers={"content-type": "application/json"})
+
+
+def test_analyze_accepts_lone_surrogate():
+    # JSON allows escaped lone surrogates; RE2 rejects them unless the engine sanitises first
+    response = post_raw(b'{"content": "urgent click now \\ud800 hello"}')
+    assert response.status_code == 200
+    assert response.json()["signals"][0]["name"] == "High-Pressure Tactics"
+
+
+def test_analyze_accepts_lone_surrogate_in_legal_and_business_content():
+    for content in (
+        b"Terms of Service. User Agreement. We sell your data \\udfff to partners.",
+        b"Partnership offer from Acme Inc \\ud800, contact bob@acme.com",
+    ):
+        response = post_raw(b'{"content": "' + content + b'"}')
+        assert response.status_code == 200